@@ -15,12 +15,15 @@ in the PDK, and relies on Klayout for GDSII operations.
 """
 
 import argparse
-import math
+import os
 import tempfile
+from collections import deque
 from pathlib import Path
-from multiprocessing import Process, Queue, cpu_count
+from multiprocessing import cpu_count, get_all_start_methods, get_context
+from multiprocessing.connection import wait
 from rich.live import Live
 from rich.console import Console
+from rich.cells import cell_len, set_cell_size
 
 from gdsfill.library.klayout import (
   get_version,
@@ -39,6 +42,153 @@ from gdsfill.library.common import (
 from gdsfill.library.fill import fill_layer
 
 
+def _open_sentinel(proc):
+    """
+    Open a waitable file descriptor which becomes readable once a child exits.
+
+    Args:
+        proc (subprocess.Popen): Child process to watch.
+
+    Returns:
+        int | None: A pidfd for the child, or None if pidfds are not supported
+        by the platform or kernel.
+    """
+    if not hasattr(os, 'pidfd_open'):
+        return None
+    try:
+        return os.pidfd_open(proc.pid)
+    except OSError:
+        return None
+
+
+def _wait_for_exit(sentinels):
+    """
+    Block until at least one of the given sentinels signals a process exit.
+
+    Falls back to a short timeout when a sentinel is missing, so callers
+    can still poll those processes.
+
+    Args:
+        sentinels (list[int | None]): Pidfds of prepare processes returned by
+            `_open_sentinel`.
+    """
+    waitable = [sentinel for sentinel in sentinels if sentinel is not None]
+    timeout = None if len(waitable) == len(sentinels) else 0.1
+    wait(waitable, timeout)
+
+
+class _TileProgress:
+    """
+    Progress display with one status line per tile.
+
+    On a terminal which is tall enough for all lines, they are printed once and
+    a finished tile only rewrites its own line using ANSI cursor movements.
+    Otherwise each line is printed once its tile has finished. Either way an
+    update costs O(1) instead of re-rendering all tiles.
+
+    The cursor movements count rows, so in-place lines must never wrap. Lines
+    wider than the terminal are cut to its width and printed in full once the
+    display is closed.
+    """
+
+    def __init__(self, console, lines):
+        """
+        Args:
+            console (Console): Console to write to.
+            lines (list[str]): Initial status line of each tile.
+        """
+        self.file = console.file
+        self.lines = lines
+        self.in_place = console.is_terminal and len(lines) < console.size.height
+        # Keep clear of the last column, some terminals wrap as soon as it is written
+        self.width = console.size.width - 1
+        self.truncated = {}
+
+    def __enter__(self):
+        if self.in_place:
+            self.file.write("\n".join(self._fit(idx, line) for idx, line in enumerate(self.lines))
+                            + "\n")
+            self.file.flush()
+        return self
+
+    def __exit__(self, *exc):
+        if self.truncated:
+            self.file.write("\n".join(self.truncated[idx] for idx in sorted(self.truncated))
+                            + "\n")
+            self.file.flush()
+        return False
+
+    def _fit(self, idx, line):
+        """
+        Cut an in-place line to the terminal width.
+
+        Args:
+            idx (int): Index of the tile line.
+            line (str): Status line.
+
+        Returns:
+            str: The line, shortened to the terminal width if needed.
+        """
+        self.truncated.pop(idx, None)
+        if cell_len(line) <= self.width:
+            return line
+        self.truncated[idx] = line
+        return set_cell_size(line, self.width)
+
+    def update(self, idx, line):
+        """
+        Replace the status line of a tile.
+
+        Args:
+            idx (int): Index of the tile line.
+            line (str): New status line.
+        """
+        self.lines[idx] = line
+        if self.in_place:
+            rows = len(self.lines) - idx
+            self.file.write(f"\x1b[{rows}A\r{self._fit(idx, line)}\x1b[K\x1b[{rows}B\r")
+        else:
+            self.file.write(line + "\n")
+        self.file.flush()
+
+
+# Per-worker state shared by all tasks of a fill pool, see `_init_fill_worker`.
+_fill_context = {}
+
+
+def _init_fill_worker(pdk, layer):
+    """
+    Pool initializer: store the read-only fill inputs once per worker.
+
+    Args:
+        pdk (PdkInformation): PDK instance with layer rules.
+        layer (str): Target layer name.
+    """
+    _fill_context['pdk'] = pdk
+    _fill_context['layer'] = layer
+
+
+def _fill_tile(task):
+    """
+    Pool worker: fill a single tile.
+
+    Failures are reported as an "error" result, so every tile delivers exactly
+    one result to the pool's shared result queue.
+
+    Args:
+        task (tuple): (tile name, modified tile file, Tile).
+
+    Returns:
+        tuple[str, tuple[str, str]]: Tile name and the result of `fill_layer`.
+    """
+    tile, file, position = task
+    try:
+        result = fill_layer(_fill_context['pdk'], file, _fill_context['layer'], position)
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        result = ("error", f"{type(e).__name__}: {e}")
+    return (tile, result)
+
+
 # pylint: disable=too-many-locals, too-many-arguments, too-many-positional-arguments
 # pylint: disable=too-many-branches, too-many-statements
 def _fill_layer(input_gds, layer, pdk, tmpdirname, *, max_processes=cpu_count(), dry_run=False):
@@ -63,75 +213,71 @@ def _fill_layer(input_gds, layer, pdk, tmpdirname, *, max_processes=cpu_count(),
     print(f">>> Layer {layer}")
 
     output_path = Path(tmpdirname) / layer
-    for stage in ('raw', 'modified', 'filled'):
-        (output_path / stage).mkdir(parents=True, exist_ok=True)
+    raw_dir, modified_dir, filled_dir = (output_path / stage
+                                         for stage in ('raw', 'modified', 'filled'))
+    for stage_dir in (raw_dir, modified_dir, filled_dir):
+        stage_dir.mkdir(parents=True, exist_ok=True)
     console = Console(color_system=None)
 
-    with Live("Exporting tiles ...\n", console=console, refresh_per_second=4) as live:
+    with Live("Exporting tiles ...\n", console=console, auto_refresh=False) as live:
         export_layer(pdk, input_gds, output_path, layer)
         live.update("Exporting tiles ... done\n")
 
     tiles = open_yaml(output_path / "tiles.yaml")
+    display_names = {tile: tile.replace('_', 'x') for tile in tiles['tiles'].keys()}
 
     print("Preparing tiles:")
-    lines = [f"  [ ] {tile.replace('_', 'x')}" for tile in tiles['tiles'].keys()]
+    lines = [f"  [ ] {name}" for name in display_names.values()]
+    pending = deque(enumerate(tiles['tiles'].keys()))
     procs_modify = {}
-    with Live("\n".join(lines), console=console, refresh_per_second=4) as live:
-        tile_keys = list(tiles['tiles'].keys())
-        for step in range(0, math.ceil(len(tile_keys) / max_processes)):
-            start = step * max_processes
-            for idx, tile in enumerate(tile_keys[slice(start, start + max_processes)]):
-                raw_tile = output_path / "raw" / f"tile_{tile}.gds"
-                proc = prepare_tile(pdk, raw_tile, layer)
-                procs_modify[start + idx] = {'tile': tile.replace('_', 'x'), 'pid': proc}
-            while procs_modify:
-                for idx in list(procs_modify):
-                    procs_modify[idx]['pid'].poll()
-                    if procs_modify[idx]['pid'].returncode is not None:
-                        lines[idx] = f"  [✔] {procs_modify[idx]['tile']}"
-                        live.update("\n".join(lines))
-                        del procs_modify[idx]
+    with _TileProgress(console, lines) as progress:
+        while pending or procs_modify:
+            # Start the next tile as soon as a slot is free instead of waiting for whole batches
+            while pending and len(procs_modify) < max(1, max_processes):
+                idx, tile = pending.popleft()
+                proc = prepare_tile(pdk, raw_dir / f"tile_{tile}.gds", layer)
+                procs_modify[idx] = {
+                    'tile': display_names[tile],
+                    'pid': proc,
+                    'sentinel': _open_sentinel(proc)
+                }
+            _wait_for_exit([entry['sentinel'] for entry in procs_modify.values()])
+            for idx in list(procs_modify):
+                procs_modify[idx]['pid'].poll()
+                if procs_modify[idx]['pid'].returncode is not None:
+                    progress.update(idx, f"  [✔] {procs_modify[idx]['tile']}")
+                    if procs_modify[idx]['sentinel'] is not None:
+                        os.close(procs_modify[idx]['sentinel'])
+                    del procs_modify[idx]
 
     print("\nFilling tiles:")
-    lines = [f"  [ ] {tile.replace('_', 'x')}" for tile in tiles['tiles'].keys()]
-    procs_fill = {}
-    with Live("\n".join(lines), console=console, refresh_per_second=4) as live:
-        tile_items = list(tiles['tiles'].items())
-        for step in range(0, math.ceil(len(tile_items) / max_processes)):
-            start = step * max_processes
-            items = tile_items[slice(start, start + max_processes)]
-            for idx, (tile, values) in enumerate(items):
-                file = output_path / "modified" / f"tile_{tile}.gds"
-                queue = Queue()
-                proc = Process(target=fill_layer,
-                               args=(pdk, file, layer, queue, Tile(values['x'], values['y'])))
-                procs_fill[start + idx] = {
-                    'tile': tile.replace('_', 'x'),
-                    'queue': queue,
-                    'pid': proc
-                }
-                proc.start()
-            while procs_fill:
-                for idx in list(procs_fill):
-                    procs_fill[idx]['pid'].join(0.1)
-                    if procs_fill[idx]['pid'].exitcode is not None:
-                        result = procs_fill[idx]['queue'].get()
-                        if result[0] == "success":
-                            symbol = "✔"
-                        elif result[0] == "skipped":
-                            symbol = "-"
-                        else:
-                            symbol = "x"
-                        lines[idx] = f"  [{symbol}] {procs_fill[idx]['tile']: <9} {result[1]}"
-                        live.update("\n".join(lines))
-                        del procs_fill[idx]
+    lines = [f"  [ ] {name}" for name in display_names.values()]
+    index = {tile: idx for idx, tile in enumerate(tiles['tiles'].keys())}
+    tasks = [
+        (tile, modified_dir / f"tile_{tile}.gds", Tile(values['x'], values['y']))
+        for tile, values in tiles['tiles'].items()
+    ]
+    # Forked workers inherit the PDK copy-on-write instead of unpickling it. Python 3.14
+    # no longer uses fork by default on Linux.
+    context = get_context("fork" if "fork" in get_all_start_methods() else None)
+    with _TileProgress(console, lines) as progress:
+        with context.Pool(processes=max(1, min(len(tasks), max_processes)),
+                          initializer=_init_fill_worker, initargs=(pdk, layer)) as pool:
+            for tile, result in pool.imap_unordered(_fill_tile, tasks):
+                if result[0] == "success":
+                    symbol = "✔"
+                elif result[0] == "skipped":
+                    symbol = "-"
+                else:
+                    symbol = "x"
+                progress.update(index[tile], f"  [{symbol}] {display_names[tile]: <9} {result[1]}")
 
     print()
     if dry_run:
         print("--dry-run enabled: skipping merge step\n")
     else:
-        with Live("Merging tiles ...\n", console=console, refresh_per_second=4) as live:
-            merge_tile(pdk, input_gds, output_path / "filled", output_path / "tiles.yaml")
+        with Live("Merging tiles ...\n", console=console, auto_refresh=False) as live:
+            merge_tile(pdk, input_gds, filled_dir, output_path / "tiles.yaml")
             live.update("Merging tiles ... done\n")
 
 
@@ -218,6 +364,28 @@ def is_valid_file(value: str):
     raise argparse.ArgumentTypeError(f"File {value} doesn't exist!")
 
 
+def is_positive_int(value: str):
+    """
+    Argparse validator: ensure argument is an integer of at least 1.
+
+    Args:
+        value (str): Integer as string.
+
+    Returns:
+        int: Validated integer.
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is not an integer or smaller than 1.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number >= 1:
+        return number
+    raise argparse.ArgumentTypeError(f"{value} is not a positive integer!")
+
+
 def arguments(args=None):
     """
     Define CLI arguments and subcommands.
@@ -237,7 +405,7 @@ def arguments(args=None):
     parser_fill.add_argument('--keep-data', action=argparse.BooleanOptionalAction)
     parser_fill.add_argument('--dry-run', action=argparse.BooleanOptionalAction)
     parser_fill.add_argument('--config-file', type=is_valid_file)
-    parser_fill.add_argument('--max-processes', type=int, default=cpu_count(),
+    parser_fill.add_argument('--max-processes', type=is_positive_int, default=cpu_count(),
                              help="Limits the number of processes for preparing and filling tiles. "
                              "Defaults to the available CPU cores.")
     parser_fill.set_defaults(func=func_fill)
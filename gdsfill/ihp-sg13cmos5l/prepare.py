@@ -17,6 +17,10 @@ import sys
 from pathlib import Path
 import pya
 import yaml
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 
 
 try:
@@ -28,9 +32,12 @@ except NameError:
 
 script = Path(__file__).parent.resolve()
 content = (script / "constants.yaml").read_text(encoding="utf-8")
-constants = yaml.safe_load(content)
+constants = yaml.load(content, Loader=SafeLoader)
 DB2NM = constants["DB2NM"]
-layers = yaml.safe_load((script / "../library/layers.yaml").read_text(encoding="utf-8"))
+layers = yaml.load((script / "../library/layers.yaml").read_text(encoding="utf-8"),
+                   Loader=SafeLoader)
+# (layer, datatype) per internal layer name, built once at import
+LAYER_TABLE = {name: (data["index"], data["type"]) for name, data in layers.items()}
 
 
 def get_layer(layer: str) -> tuple[int, int]:
@@ -43,7 +50,7 @@ def get_layer(layer: str) -> tuple[int, int]:
     Returns:
         tuple[int, int]: (layer index, datatype)
     """
-    return (layers[layer]["index"], layers[layer]["type"])
+    return LAYER_TABLE[layer]
 
 
 def prepare_activ(top_cell):
@@ -62,7 +69,8 @@ def prepare_activ(top_cell):
     """
     gatpoly = pya.Region(top_cell.begin_shapes_rec(layout.layer(*get_layer("keep_away_1"))))
     cont = pya.Region(top_cell.begin_shapes_rec(layout.layer(*get_layer("keep_away_2"))))
-    AFil_c = gatpoly.sized(1.1 * DB2NM) + cont.sized(1.1 * DB2NM)
+    # Growing is distributive over the union, so size the joined inputs only once
+    AFil_c = (gatpoly + cont).sized(1.1 * DB2NM)
     del gatpoly
     del cont
 
@@ -111,8 +119,8 @@ def prepare_gatpoly(top_cell):
     psd = pya.Region(top_cell.begin_shapes_rec(layout.layer(*get_layer("keep_away_6"))))
     nsd_block = pya.Region(top_cell.begin_shapes_rec(layout.layer(*get_layer("keep_away_7"))))
     salblock = pya.Region(top_cell.begin_shapes_rec(layout.layer(*get_layer("keep_away_8"))))
-    GFil_d = gatpoly.sized(1.1 * DB2NM) + cont.sized(1.1 * DB2NM) + activ.sized(1.1 * DB2NM) + \
-        psd.sized(1.1 * DB2NM) + nsd_block.sized(1.1 * DB2NM) + salblock.sized(1.1 * DB2NM)
+    # Growing is distributive over the union, so size the joined inputs only once
+    GFil_d = (gatpoly + cont + activ + psd + nsd_block + salblock).sized(1.1 * DB2NM)
     del activ
     del gatpoly
     del cont
@@ -18,6 +18,10 @@ from pathlib import Path
 import sys
 import pya
 import yaml
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 
 try:
     layers  # pylint: disable=used-before-assignment
@@ -30,21 +34,33 @@ selected_layers = layers.split(',')  # noqa: F821
 
 script = Path(__file__).parent.resolve()
 content = (script / "constants.yaml").read_text(encoding='utf-8')
-constants = yaml.safe_load(content)
+constants = yaml.load(content, Loader=SafeLoader)
 
 layout = pya.CellView.active().layout()
 design_cell = layout.top_cell()
 
-edgeseal = pya.Region(design_cell.begin_shapes_rec(layout.layer(39, 0))).merged()
-density_area = (edgeseal + edgeseal.holes()).area()
-for layer, data in constants['layers'].items():
-    if layer not in selected_layers:
-        continue
 
-    metal = pya.Region(design_cell.begin_shapes_rec(layout.layer(data['index'], data['drawing'])))
-    fill = pya.Region(design_cell.begin_shapes_rec(layout.layer(data['index'], data['fill'])))
+def get_area(layer_id) -> int:
+    """
+    Return the area of all shapes on a layer, or 0 if the layout lacks the layer.
+    """
+    if layer_id is None:
+        return 0
+    return pya.Region(design_cell.begin_shapes_rec(layer_id)).area()
+
 
-    metal_per = (metal.area() / density_area) * 100
-    fill_per = (fill.area() / density_area) * 100
+# Resolve layer ids once; find_layer() does not create missing layers
+layer_ids = [
+    (layer, layout.find_layer(data['index'], data['drawing']),
+     layout.find_layer(data['index'], data['fill']))
+    for layer, data in constants['layers'].items()
+    if layer in selected_layers
+]
+
+edgeseal = pya.Region(design_cell.begin_shapes_rec(layout.layer(39, 0))).merged()
+density_area = (edgeseal + edgeseal.holes()).area()
+for layer, metal_id, fill_id in layer_ids:
+    metal_per = (get_area(metal_id) / density_area) * 100
+    fill_per = (get_area(fill_id) / density_area) * 100
 
     print(f"{layer}: {round(metal_per + fill_per, 2)} %")
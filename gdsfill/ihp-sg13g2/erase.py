@@ -13,6 +13,10 @@ from pathlib import Path
 import sys
 import pya
 import yaml
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 
 try:
     layers  # pylint: disable=used-before-assignment
@@ -25,16 +29,22 @@ selected_layers = layers.split(',')  # noqa: F821
 
 script = Path(__file__).parent.resolve()
 content = (script / "constants.yaml").read_text(encoding='utf-8')
-constants = yaml.safe_load(content)
+constants = yaml.load(content, Loader=SafeLoader)
 
 layout = pya.CellView.active().layout()
 
 
+# Resolve layer ids once; fill layers missing in the layout have nothing to erase
+fill_ids = [
+    layout.find_layer(data['index'], data['fill'])
+    for layer, data in constants['layers'].items()
+    if layer in selected_layers
+]
+
 layout.start_changes()
-for layer, data in constants['layers'].items():
-    if layer not in selected_layers:
-        continue
-    layout.clear_layer(layout.layer(data['index'], data['fill']))
+for fill_id in fill_ids:
+    if fill_id is not None:
+        layout.clear_layer(fill_id)
 layout.end_changes()
 
 print(f"Write GDSII with cleared layers to {pya.CellView.active().filename()}")
@@ -9,11 +9,17 @@ Tile preparation script for KLayout dummy fill flow.
 
 import sys
 import hashlib
+import itertools
+import mmap
 import random
 import string
 from pathlib import Path
 import pya
 import yaml
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
 
 # Validate runtime arguments
 # pylint: disable=duplicate-code
@@ -40,9 +46,13 @@ tile_width = int(tile_width)  # noqa: F821  # pylint: disable=undefined-variable
 # Load constants
 script = Path(__file__).parent.resolve()
 content = (script / "constants.yaml").read_text(encoding="utf-8")
-constants = yaml.safe_load(content)
+constants = yaml.load(content, Loader=SafeLoader)
 DB2NM = constants["DB2NM"]
-layers = yaml.safe_load((script / "../library/layers.yaml").read_text(encoding="utf-8"))
+STDCELL_HEIGHT = round(3.78 * DB2NM)
+layers = yaml.load((script / "../library/layers.yaml").read_text(encoding="utf-8"),
+                   Loader=SafeLoader)
+# (layer, datatype) per internal layer name, built once at import
+LAYER_TABLE = {name: (data["index"], data["type"]) for name, data in layers.items()}
 
 
 def get_layer(layer: str) -> tuple[int, int]:
@@ -55,7 +65,23 @@ def get_layer(layer: str) -> tuple[int, int]:
     Returns:
         tuple[int, int]: (layer index, datatype)
     """
-    return (layers[layer]["index"], layers[layer]["type"])
+    return LAYER_TABLE[layer]
+
+
+def get_region(layout, cell, layer_number: int, datatype: int) -> pya.Region:
+    """
+    Collect the shapes of a design layer from the whole cell hierarchy.
+
+    Args:
+        layout (pya.Layout): The active layout.
+        cell (pya.Cell): The design cell.
+        layer_number (int): The layer index.
+        datatype (int): The layer datatype.
+
+    Returns:
+        pya.Region: Region containing all shapes of the layer.
+    """
+    return pya.Region(cell.begin_shapes_rec(layout.layer(layer_number, datatype)))
 
 
 def get_nofill(layout, cell, layer_number: int) -> pya.Region:
@@ -70,8 +96,7 @@ def get_nofill(layout, cell, layer_number: int) -> pya.Region:
     Returns:
         pya.Region: Region containing no-fill shapes.
     """
-    layer = layout.layer(layer_number, 23)
-    return pya.Region(cell.begin_shapes_rec(layer))
+    return get_region(layout, cell, layer_number, 23)
 
 
 def get_fill_area(layout, cell) -> pya.Region:
@@ -85,30 +110,45 @@ def get_fill_area(layout, cell) -> pya.Region:
     Returns:
         pya.Region: Fill area region.
     """
-    layer = layout.layer(39, 0)
-    ring = pya.Region(cell.begin_shapes_rec(layer)).merged()
+    ring = get_region(layout, cell, 39, 0).merged()
     return (ring + ring.holes()).merge()
 
 
+def get_checksum(filename: str) -> str:
+    """
+    Return a 128-bit checksum of a file as hex string.
+
+    The checksum only identifies the source design and is always BLAKE2b,
+    so the same file gets the same checksum on every machine. Uses
+    `hashlib.file_digest` where available (Python 3.11+) and hashes a memory
+    map of the file otherwise, so the digest runs in a single C loop.
+    """
+    def new_hash(data=b""):
+        return hashlib.blake2b(data, digest_size=16)
+    with open(filename, "rb") as gds:
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(gds, new_hash).hexdigest()
+        with mmap.mmap(gds.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return new_hash(mapped).hexdigest()
+
+
 def get_die_size(layout, cell) -> tuple[int, int]:
     """
     Return die width and height in microns.
     """
-    layer = layout.layer(39, 4)
-    edgeseal = pya.Region(cell.begin_shapes_rec(layer))
-    return (int(edgeseal.bbox().width() / DB2NM), int(edgeseal.bbox().height() / DB2NM))
+    die = get_region(layout, cell, 39, 4).bbox()
+    return (int(die.width() / DB2NM), int(die.height() / DB2NM))
 
 
 def get_core_area(layout, cell):
     """
     Returns a Region of stdcells, expanded by 5 nm, restricted to the core area for fill algorithms.
     """
-    stdcells = [
-        poly
-        for poly in pya.Region(cell.begin_shapes_rec(layout.layer(189, 4)))
-        if poly.bbox().height() == (3.78 * DB2NM)
-    ]
-    return pya.Region(stdcells).merged().sized(5.0 * DB2NM).merged()
+    boundaries = pya.Region(cell.begin_shapes_rec(layout.layer(189, 4)))
+    # Filter the single cell outlines, not abutting rows merged together
+    boundaries.merged_semantics = False
+    stdcells = boundaries.with_bbox_height(STDCELL_HEIGHT, False)
+    return stdcells.merged().sized(5.0 * DB2NM).merged()
 
 
 def generate_border(x: int, y: int, tile_width_: int, space: float):
@@ -146,18 +186,18 @@ def get_activ(layout, design_cell, tmp_cell, layer_number: int):
     Collect polygons for the activ layer and insert them into the temporary cell.
     """
     metal = pya.Region(design_cell.begin_shapes_rec(layout.layer(layer_number, 0)))
-    tmp_cell.shapes(layout.layer(*get_layer("drawing"))).insert(metal.merged())
-    trans = pya.Region(design_cell.begin_shapes_rec(layout.layer(26, 0)))
+    tmp_cell.shapes(layout.layer(*get_layer("drawing"))).insert(metal.merge())
+    trans = get_region(layout, design_cell, 26, 0)
     tmp_cell.shapes(layout.layer(*get_layer("keep_away_0"))).insert(trans)
-    gatpoly = pya.Region(design_cell.begin_shapes_rec(layout.layer(5, 0)))
+    gatpoly = get_region(layout, design_cell, 5, 0)
     tmp_cell.shapes(layout.layer(*get_layer("keep_away_1"))).insert(gatpoly)
-    cont = pya.Region(design_cell.begin_shapes_rec(layout.layer(6, 0)))
+    cont = get_region(layout, design_cell, 6, 0)
     tmp_cell.shapes(layout.layer(*get_layer("keep_away_2"))).insert(cont)
-    nwell = pya.Region(design_cell.begin_shapes_rec(layout.layer(31, 0)))
+    nwell = get_region(layout, design_cell, 31, 0)
     tmp_cell.shapes(layout.layer(*get_layer("keep_away_3"))).insert(nwell)
-    nbulay = pya.Region(design_cell.begin_shapes_rec(layout.layer(32, 0)))
+    nbulay = get_region(layout, design_cell, 32, 0)
     tmp_cell.shapes(layout.layer(*get_layer("keep_away_4"))).insert(nbulay)
-    pwell_block = pya.Region(design_cell.begin_shapes_rec(layout.layer(46, 21)))
+    pwell_block = get_region(layout, design_cell, 46, 21)
     tmp_cell.shapes(layout.layer(*get_layer("keep_away_5"))).insert(pwell_block)
 
     nofill = get_nofill(layout, design_cell, layer_number)
@@ -176,27 +216,27 @@ def get_gatpoly(layout, design_cell, tmp_cell, layer_number: int):
     """
 
     metal = pya.Region(design_cell.begin_shapes_rec(layout.layer(layer_number, 0)))
-    tmp_cell.shapes(layout.layer(*get_layer("drawing"))).insert(metal.merged())
-    activ_filler = pya.Region(design_cell.begin_shapes_rec(layout.layer(1, 22)))
+    tmp_cell.shapes(layout.layer(*get_layer("drawing"))).insert(metal.merge())
+    activ_filler = get_region(layout, design_cell, 1, 22)
     tmp_cell.shapes(layout.layer(*get_layer("reference"))).insert(activ_filler)
-    trans = pya.Region(design_cell.begin_shapes_rec(layout.layer(26, 0)))
+    trans = get_region(layout, design_cell, 26, 0)
     tmp_cell.shapes(layout.layer(*get_layer("keep_away_0"))).insert(trans)
-    gatpoly = pya.Region(design_cell.begin_shapes_rec(layout.layer(5, 0)))
+    gatpoly = get_region(layout, design_cell, 5, 0)
     tmp_cell.shapes(layout.layer(*get_layer("keep_away_1"))).insert(gatpoly)
-    cont = pya.Region(design_cell.begin_shapes_rec(layout.layer(6, 0)))
+    cont = get_region(layout, design_cell, 6, 0)
     tmp_cell.shapes(layout.layer(*get_layer("keep_away_2"))).insert(cont)
-    nwell = pya.Region(design_cell.begin_shapes_rec(layout.layer(31, 0)))
+    nwell = get_region(layout, design_cell, 31, 0)
     tmp_cell.shapes(layout.layer(*get_layer("keep_away_3"))).insert(nwell)
-    nbulay = pya.Region(design_cell.begin_shapes_rec(layout.layer(32, 0)))
+    nbulay = get_region(layout, design_cell, 32, 0)
     tmp_cell.shapes(layout.layer(*get_layer("keep_away_4"))).insert(nbulay)
 
-    activ = pya.Region(design_cell.begin_shapes_rec(layout.layer(1, 0)))
+    activ = get_region(layout, design_cell, 1, 0)
     tmp_cell.shapes(layout.layer(*get_layer("keep_away_5"))).insert(activ)
-    psd = pya.Region(design_cell.begin_shapes_rec(layout.layer(14, 0)))
+    psd = get_region(layout, design_cell, 14, 0)
     tmp_cell.shapes(layout.layer(*get_layer("keep_away_6"))).insert(psd)
-    nsd_block = pya.Region(design_cell.begin_shapes_rec(layout.layer(7, 21)))
+    nsd_block = get_region(layout, design_cell, 7, 21)
     tmp_cell.shapes(layout.layer(*get_layer("keep_away_7"))).insert(nsd_block)
-    salblock = pya.Region(design_cell.begin_shapes_rec(layout.layer(28, 0)))
+    salblock = get_region(layout, design_cell, 28, 0)
     tmp_cell.shapes(layout.layer(*get_layer("keep_away_8"))).insert(salblock)
 
     nofill = get_nofill(layout, design_cell, layer_number)
@@ -213,8 +253,8 @@ def get_metal(layout, design_cell, tmp_cell, layer_number: int) -> None:
     Collect polygons for metal layers and insert them into the temporary cell.
     """
     metal = pya.Region(design_cell.begin_shapes_rec(layout.layer(layer_number, 0)))
-    tmp_cell.shapes(layout.layer(*get_layer("drawing"))).insert(metal.merged())
-    trans = pya.Region(design_cell.begin_shapes_rec(layout.layer(26, 0)))
+    tmp_cell.shapes(layout.layer(*get_layer("drawing"))).insert(metal.merge())
+    trans = get_region(layout, design_cell, 26, 0)
     tmp_cell.shapes(layout.layer(*get_layer("keep_away_0"))).insert(trans)
 
     placement_cell = get_core_area(layout, design_cell)
@@ -234,8 +274,8 @@ def get_topmetal(layout, design_cell, tmp_cell, layer_number: int) -> None:
     Collect polygons for top-metal layers and insert them into the temporary cell.
     """
     top_metal = pya.Region(design_cell.begin_shapes_rec(layout.layer(layer_number, 0)))
-    tmp_cell.shapes(layout.layer(*get_layer("drawing"))).insert(top_metal.merged())
-    trans = pya.Region(design_cell.begin_shapes_rec(layout.layer(26, 0)))
+    tmp_cell.shapes(layout.layer(*get_layer("drawing"))).insert(top_metal.merge())
+    trans = get_region(layout, design_cell, 26, 0)
     tmp_cell.shapes(layout.layer(*get_layer("keep_away_0"))).insert(trans)
 
     placement_cell = get_core_area(layout, design_cell)
@@ -277,8 +317,9 @@ def export_tiles(output_dir: Path, layer_name: str, tile_width_: int):
 
     This function splits the design into tiles of the given width, applies
     layer-specific processing (e.g., inserting borders and keep-out regions),
-    and exports each tile as a separate GDSII file. It also collects metadata
-    about die size, core size, core origin, and a checksum of the source design.
+    and exports each tile overlapping the sealring as a separate GDSII file.
+    It also collects metadata about die size, core size, core origin, and a
+    checksum of the source design.
 
     Args:
         output_dir (Path): Directory where the generated `raw` tiles and
@@ -289,7 +330,7 @@ def export_tiles(output_dir: Path, layer_name: str, tile_width_: int):
 
     Returns:
         dict: A dictionary containing die dimensions, core dimensions and origin,
-        per-tile metadata (coordinates, size), and an MD5 checksum of the source GDS.
+        per-tile metadata (coordinates, size), and a checksum of the source GDS.
 
     Raises:
         KeyError: If the given `layer_name` is not present in the configuration.
@@ -311,41 +352,51 @@ def export_tiles(output_dir: Path, layer_name: str, tile_width_: int):
 
     die_width, die_height = get_die_size(layout, design_cell)
 
-    # Compute checksum
-    with open(pya.CellView.active().filename(), "rb") as gds:
-        file_hash = hashlib.md5()
-        while chunk := gds.read(8192):
-            file_hash.update(chunk)
-
     data = {
         "die": {"width": die_width, "height": die_height},
         "tiles": {},
-        "checksum": file_hash.hexdigest(),
+        "checksum": get_checksum(pya.CellView.active().filename()),
     }
 
-    for x in range(0, die_width, tile_width_):
-        for y in range(0, die_height, tile_width_):
-            tile_name = f"{x}_{y}"
-            file_name = f"tile_{tile_name}.gds"
-            data["tiles"][tile_name] = {
-                "x": x,
-                "y": y,
-                "width": min(tile_width_, die_width - x),
-                "height": min(tile_width_, die_height - y),
-            }
-
-            box_bottom, box_top, box_left, box_right = FUNC_BORDER_MAPPING[layer_name](
-                x, y, tile_width_
-            )
-            tmp_cell.shapes(layout.layer(*get_layer("tile_border"))).insert(box_bottom)
-            tmp_cell.shapes(layout.layer(*get_layer("tile_border"))).insert(box_top)
-            tmp_cell.shapes(layout.layer(*get_layer("tile_border"))).insert(box_left)
-            tmp_cell.shapes(layout.layer(*get_layer("tile_border"))).insert(box_right)
-
-            clip_rect = pya.Box(x * DB2NM, y * DB2NM,
-                                (x + tile_width_) * DB2NM, (y + tile_width_) * DB2NM)
-            layout.clip(layout.cell(tmp_filler_top_name), clip_rect).write(
-                output_dir / "raw" / file_name)
+    # Tiles are intermediate data, so skip KLayout's context information
+    save_options = pya.SaveLayoutOptions()
+    save_options.write_context_info = False
+
+    # Per-axis tile origins, sizes and database unit bounds are computed once and
+    # combined per tile instead of being recomputed in the inner loop.
+    columns = [(x, min(tile_width_, die_width - x), x * DB2NM, (x + tile_width_) * DB2NM)
+               for x in range(0, die_width, tile_width_)]
+    rows = [(y, min(tile_width_, die_height - y), y * DB2NM, (y + tile_width_) * DB2NM)
+            for y in range(0, die_height, tile_width_)]
+
+    # Border boxes of the tile at the origin, shifted to each tile below
+    border_template = pya.Region()
+    for box in FUNC_BORDER_MAPPING[layer_name](0, 0, tile_width_):
+        border_template.insert(box)
+    sealring_bbox = sealring.bbox()
+    borders = pya.Region()
+    clip_rects = []
+    for (x, width, left, right), (y, height, bottom, top) in itertools.product(columns, rows):
+        clip_rect = pya.Box(left, bottom, right, top)
+        # Tiles outside the sealring have nothing to fill and are left out of tiles.yaml.
+        # The bounding box test rejects most of them without a region query.
+        if not sealring_bbox.overlaps(clip_rect) or \
+                sealring.overlapping(pya.Region(clip_rect)).is_empty():
+            continue
+        data["tiles"][f"{x}_{y}"] = {"x": x, "y": y, "width": width, "height": height}
+
+        borders.insert(border_template.moved(left, bottom))
+
+        clip_rects.append(clip_rect)
+
+    # Borders of all tiles go into the temporary cell in a single insert
+    tmp_cell.shapes(layout.layer(*get_layer("tile_border"))).insert(borders)
+
+    # Clip all tiles in a single pass over the temporary cell's hierarchy. Borders of
+    # neighbouring tiles only touch a clip rectangle and drop out of the clipped cell.
+    clipped_cells = layout.multi_clip(tmp_cell, clip_rects)
+    for tile_name, clipped_cell in zip(data["tiles"], clipped_cells):
+        clipped_cell.write(output_dir / "raw" / f"tile_{tile_name}.gds", save_options)
 
     return data
 
@@ -356,7 +407,7 @@ tile_data = export_tiles(outputdir, layer_name, tile_width)  # noqa: F821
 
 # Write metadata YAML
 try:
-    with (outputdir / "tiles.yaml").open("w") as f:
-        yaml.safe_dump(tile_data, f, default_flow_style=False)
+    with (outputdir / "tiles.yaml").open("w", buffering=1 << 20) as f:
+        yaml.dump(tile_data, f, Dumper=SafeDumper, default_flow_style=None)
 except (OSError, yaml.YAMLError) as e:
     print(f"Failed to write YAML file: {e}")
@@ -14,6 +14,10 @@ import sys
 from pathlib import Path
 import pya
 import yaml
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 
 # pylint: disable=duplicate-code
 try:
@@ -31,20 +35,24 @@ except NameError:
 
 script = Path(__file__).parent.resolve()
 content = (script / "constants.yaml").read_text(encoding='utf-8')
-constants = yaml.safe_load(content)
+constants = yaml.load(content, Loader=SafeLoader)
 
 # pylint: disable=undefined-variable
-tiles = yaml.safe_load(Path(tiles_file).read_text(encoding='utf-8'))  # noqa: F821
+tiles = yaml.load(Path(tiles_file).read_text(encoding='utf-8'), Loader=SafeLoader)  # noqa: F821
 
 layout = pya.CellView.active().layout()
 
-layout.start_changes()
-for tile, data in tiles['tiles'].items():
-    filled_layout = pya.Layout()
+# Read all tiles into one scratch layout. Fill cells of the same name are merged
+# on read, so only a handful of top cells have to be copied into the design.
+filled_layout = pya.Layout()
+for tile in tiles['tiles']:
     filled_layout.read(Path(output_path) / f"tile_{tile}.gds")  # noqa: F821
-    print(f"Merging all tiles into tile_{tile}.gds")
-    for topcell in filled_layout.top_cells():
-        layout.top_cell().copy_tree(topcell)
+    print(f"Reading filled tile_{tile}.gds")
+
+layout.start_changes()
+design_cell = layout.top_cell()
+for topcell in filled_layout.top_cells():
+    design_cell.copy_tree(topcell)
 layout.end_changes()
 
 print(f"Write GDS with cleared layers to {pya.CellView.active().filename()}")
@@ -21,6 +21,10 @@ from dataclasses import dataclass
 from pathlib import Path
 import yaml
 from packaging.version import Version
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 
 
 class PdkNotSupportedError(Exception):
@@ -262,4 +266,4 @@ def open_yaml(yamlfile: Path):
         dict or bool: Parsed YAML content, or False if the file does not exist.
     """
     content = Path(yamlfile).read_text(encoding='utf-8')
-    return yaml.safe_load(content)
+    return yaml.load(content, Loader=SafeLoader)
@@ -10,7 +10,7 @@ and applying it to a given tile and layer.
 """
 import gdstk
 
-from gdsfill.library.filler.helper import calculate_density
+from gdsfill.library.filler.helper import FILL_INPUT_LAYERS, calculate_density
 from gdsfill.library.filler.overlap import fill_overlap
 from gdsfill.library.filler.square import fill_square
 from gdsfill.library.filler.track import fill_track
@@ -24,7 +24,7 @@ ALGOS = {
 
 
 # pylint: disable=too-many-arguments, too-many-positional-arguments, too-many-locals
-def fill_layer(pdk, inputfile, layer, queue, tile):
+def fill_layer(pdk, inputfile, layer, tile):
     """
     Fill a layout layer to meet density requirements.
 
@@ -35,13 +35,12 @@ def fill_layer(pdk, inputfile, layer, queue, tile):
         pdk (object): Provides layer rules and supported algorithms.
         inputfile (Path | str): Path to the input GDS file.
         layer (str): Target layer name.
-        queue (Queue): Queue object to return results.
         tile (object): Current tile instance.
 
     Returns:
-        bool: True if successful, False if algorithm unsupported.
+        tuple[str, str]: Status ("success", "skipped" or "error") and a message.
     """
-    library = gdstk.read_gds(inputfile, unit=1e-6)
+    library = gdstk.read_gds(inputfile, unit=1e-6, filter=FILL_INPUT_LAYERS)
     annotated_cell = library.top_level()[0]
 
     metal_density = calculate_density(annotated_cell)
@@ -50,13 +49,11 @@ def fill_layer(pdk, inputfile, layer, queue, tile):
 
     for fill_algo in fill_algos:
         if fill_algo not in ALGOS:
-            queue.put(("error", f"Unknown fill algorithm {fill_algo} for layer {layer}"))
-            return False
+            return ("error", f"Unknown fill algorithm {fill_algo} for layer {layer}")
 
     for fill_algo in fill_algos:
         if not pdk.has_fill_algorithm(layer, fill_algo):
-            queue.put(("error", f"Unsupported fill algorithm {fill_algo} for layer {layer}"))
-            return False
+            return ("error", f"Unsupported fill algorithm {fill_algo} for layer {layer}")
 
     msg = f"Metal density {metal_density: <5} % (target {desired_density} %)"
     fill_lib = gdstk.Library("fill")
@@ -68,9 +65,9 @@ def fill_layer(pdk, inputfile, layer, queue, tile):
             fill_lib.add(fill_cell)
             fills.append((fill_algo, result))
         final_fill = round(metal_density + sum(fill for _, fill in fills), 2)
-        queue.put(("success", f"{msg} - final density {final_fill} % "))
+        result = ("success", f"{msg} - final density {final_fill} % ")
     else:
-        queue.put(("skipped", f"{msg} - exceeds limit"))
+        result = ("skipped", f"{msg} - exceeds limit")
 
     fill_lib.write_gds(str(inputfile).replace('modified', 'filled'))
-    return True
+    return result
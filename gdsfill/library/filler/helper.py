@@ -14,53 +14,73 @@ from collections import Counter
 from pathlib import Path
 import yaml
 import gdstk
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 
 
 script = Path(__file__).parent.resolve()
-layers = yaml.safe_load((script / "../layers.yaml").read_text(encoding='utf-8'))
+layers = yaml.load((script / "../layers.yaml").read_text(encoding='utf-8'), Loader=SafeLoader)
+# gdstk layer/datatype keyword arguments per internal layer name, built once at import
+_LAYER_KWARGS = {name: {'layer': data['index'], 'datatype': data['type']}
+                 for name, data in layers.items()}
+# Annotated tile layers read by the fill algorithms; all other layers can be skipped on read
+FILL_INPUT_LAYERS = frozenset((layers[name]['index'], layers[name]['type']) for name in (
+    'drawing', 'keep_out', 'placement_chip', 'placement_core', 'reference'))
 
 
-def calculate_core_density(top_cell):
+def as_point_list(polygon):
     """
-    Calculate metal density within the core placement region.
+    Convert polygon vertices into a list of mutable [x, y] lists.
+
+    gdstk returns vertices as a NumPy array. Indexing it element by element
+    from Python is several times slower than indexing plain lists, so the
+    per-polygon helpers convert it once up front.
 
     Args:
-        top_cell (gdstk.Cell): Layout cell.
+        polygon (numpy.ndarray | list[tuple[float, float]]): Polygon vertices.
 
     Returns:
-        float: Core density percentage (0–100).
+        list[list[float]]: Polygon vertices as lists.
     """
-    total_area = sum(polygon.area() for polygon in get_polygons(top_cell, 'placement_core'))
-    if total_area == 0:
-        return 0
-    valid_metal = gdstk.boolean(get_polygons(top_cell, 'placement_core'),
-                                get_polygons(top_cell, 'drawing'), operation='and')
-    total_metal_area = sum(polygon.area() for polygon in valid_metal)
-    if total_metal_area == 0:
+    if hasattr(polygon, 'tolist'):
+        return polygon.tolist()
+    return [list(point) for point in polygon]
+
+
+def area_percentage(area: float, total_area: float) -> float:
+    """
+    Express an area as a rounded percentage of a total area.
+
+    Args:
+        area (float): Covered area.
+        total_area (float): Reference area.
+
+    Returns:
+        float: Percentage (0–100), or 0 if either area is empty.
+    """
+    if total_area == 0 or area == 0:
         return 0
-    return round((total_metal_area / total_area) * 100, 2)
+    return round((area / total_area) * 100, 2)
 
 
-def calculate_core_fill_density(top_cell, cell):
+def calculate_core_density(top_cell):
     """
-    Calculate filler density within the core placement region.
+    Calculate metal density within the core placement region.
 
     Args:
         top_cell (gdstk.Cell): Layout cell.
-        cell (gdstk.Cell): Candidate filler cell.
 
     Returns:
-        float: Core fill density percentage (0–100).
+        float: Core density percentage (0–100).
     """
-    total_area = sum(polygon.area() for polygon in get_polygons(top_cell, 'placement_core'))
+    core = get_polygons(top_cell, 'placement_core')
+    total_area = sum(polygon.area() for polygon in core)
     if total_area == 0:
         return 0
-    valid_fill = gdstk.boolean(get_polygons(top_cell, 'placement_core'),
-                               cell.get_polygons(), operation='and')
-    total_fill_area = sum(polygon.area() for polygon in valid_fill)
-    if total_fill_area == 0:
-        return 0
-    return round((total_fill_area / total_area) * 100, 2)
+    valid_metal = gdstk.boolean(core, get_polygons(top_cell, 'drawing'), operation='and')
+    return area_percentage(sum(polygon.area() for polygon in valid_metal), total_area)
 
 
 def calculate_density(top_cell):
@@ -77,9 +97,7 @@ def calculate_density(top_cell):
     if total_area == 0:
         return 0
     total_metal_area = sum(polygon.area() for polygon in get_polygons(top_cell, 'drawing'))
-    if total_metal_area == 0:
-        return 0
-    return round((total_metal_area / total_area) * 100, 2)
+    return area_percentage(total_metal_area, total_area)
 
 
 def calculate_fill_density(top_cell, cell):
@@ -96,10 +114,8 @@ def calculate_fill_density(top_cell, cell):
     total_area = sum(polygon.area() for polygon in get_polygons(top_cell, 'placement_chip'))
     if total_area == 0:
         return 0
-    total_fill_area = sum(polygon.area() for polygon in cell.get_polygons())
-    if total_fill_area == 0:
-        return 0
-    return round((total_fill_area / total_area) * 100, 2)
+    # Cell.area sums in C without copying every polygon out of the cell
+    return area_percentage(cell.area(), total_area)
 
 
 def check_is_square(polygon, min_width=None):
@@ -113,20 +129,13 @@ def check_is_square(polygon, min_width=None):
     Returns:
         bool: True if square and valid.
     """
-    p0, p1, p2, p3 = polygon
+    (x0, y0), (x1, y1), (x2, y2), (x3, y3) = as_point_list(polygon)
 
-    height1 = p0[0] - p1[0]
-    height2 = p3[0] - p2[0]
-    width1 = p0[1] - p3[1]
-    width2 = p1[1] - p2[1]
-
-    if width1 != width2:
-        return False
-    if height1 != height2:
+    height1 = x0 - x1
+    width1 = y0 - y3
+    if width1 != y1 - y2 or height1 != x3 - x2:
         return False
-    if min_width is not None and (width1 < min_width or height1 < min_width):
-        return False
-    return True
+    return min_width is None or (width1 >= min_width and height1 >= min_width)
 
 
 def check_min_size(polygon, min_width=None, min_height=None):
@@ -134,17 +143,17 @@ def check_min_size(polygon, min_width=None, min_height=None):
     Check if a polygon meets minimum width/height.
 
     Args:
-        polygon (list[tuple[float, float]]): Polygon vertices.
+        polygon (gdstk.Polygon): Polygon to check.
         min_width (float, optional): Minimum width.
         min_height (float, optional): Minimum height.
 
     Returns:
         bool: True if requirements are met.
     """
-    xs = [p[0] for p in polygon]
-    ys = [p[1] for p in polygon]
-    width = max(xs) - min(xs)
-    height = max(ys) - min(ys)
+    # The bounding box is computed in C, no need to unpack the vertices in Python
+    (x_min, y_min), (x_max, y_max) = polygon.bounding_box()
+    width = x_max - x_min
+    height = y_max - y_min
 
     if min_width is not None and width < min_width:
         return False
@@ -242,9 +251,10 @@ def get_layer(layer: str):
         layer (str): Layer name.
 
     Returns:
-        dict: Dictionary with 'layer' index and 'datatype'.
+        dict: Dictionary with 'layer' index and 'datatype'. The dictionary is
+        shared between callers and must not be modified.
     """
-    return {'layer': layers[layer]['index'], 'datatype': layers[layer]['type']}
+    return _LAYER_KWARGS[layer]
 
 
 def get_track_offset(tracks, tile_x: float, gap: float) -> float:
@@ -373,11 +383,12 @@ def remove_shortest_edge(polygon, layerindex, datatype):
     Returns:
         gdstk.Polygon: Adjusted 4-vertex polygon.
     """
+    polygon = as_point_list(polygon)
     n = len(polygon)
     m = n - 2
     # Find the shortest edge
-    edges = [(i, edge_length(polygon[i], polygon[(i+1) % n])) for i in range(n)]
-    min_index, _ = min(edges, key=lambda x: x[1])
+    lengths = [edge_length(polygon[i], polygon[(i+1) % n]) for i in range(n)]
+    min_index = lengths.index(min(lengths))
 
     # Remove the two vertices that form this edge
     new_poly = [polygon[i] for i in range(n) if i not in (min_index, (min_index+1) % n)]
@@ -200,7 +200,7 @@ def _fill_overlap_logic(pdk, layer: str, annotated_cell, references, width, heig
     filler_cell = gdstk.Cell(name='FILLER_CELL_OVERLAP')
     chip_placement = get_polygons(annotated_cell, 'placement_chip')
     keep_out = get_polygons(annotated_cell, 'keep_out')
-    for fill in filler.get_polygons():
+    for fill in filler.polygons:
         in_placement = gdstk.inside(fill.points, chip_placement)
         outside_keep_out = gdstk.inside(fill.points, keep_out)
         if any(in_placement) and not any(outside_keep_out):
@@ -114,11 +114,15 @@ def fill_square(pdk, layer: str, tile, annotated_cell, fill_density: float):
 
     parameter = SquareParameter(size=size, space=space, position=position, density=density,
                                 max_depth=max_depth)
+    # The blocking layers do not change while squares are placed, so fetch them once
+    placement = get_polygons(annotated_cell, 'placement_chip')
+    keep_out = get_polygons(annotated_cell, 'keep_out')
 
-    return _fill_square(pdk, layer, tile, annotated_cell, parameter)
+    return _fill_square(pdk, layer, tile, annotated_cell, parameter, placement, keep_out)
 
 
-def _fill_square(pdk, layer: str, tile, annotated_cell, parameter: SquareParameter):
+def _fill_square(pdk, layer: str, tile, annotated_cell, parameter: SquareParameter,
+                 placement: list, keep_out: list):
     """
     Iteratively refine square size and spacing to reach density targets.
 
@@ -127,49 +131,56 @@ def _fill_square(pdk, layer: str, tile, annotated_cell, parameter: SquareParamet
         layer (str): Target layer.
         tile (object): Current tile instance.
         annotated_cell (gdstk.Cell): Cell to update.
-        size (tuple[float, float]): Min and max square sizes.
-        space (tuple[float, float]): Min and max spacing.
-        position (tuple[float, float]): Current size and spacing start values.
-        density (float): Current density of annotated cell.
-        max_depth (int): Remaining recursion depth.
+        parameter (SquareParameter): Initial size and spacing intervals, start values,
+            current density and maximum refinement depth.
+        placement (list[gdstk.Polygon]): Chip placement polygons of the annotated cell.
+        keep_out (list[gdstk.Polygon]): Keep-out polygons of the annotated cell.
 
     Returns:
         tuple[gdstk.Cell, str]: Cell containing filler polygons and fill result.
     """
-    values = list(itertools.product(parameter.size, parameter.space))
-
-    results = []
-    for (size_, space_) in values:
-        filler_grid = _fill_square_logic(pdk, layer, tile, annotated_cell, size_, space_)
-        fill_density = calculate_fill_density(annotated_cell, filler_grid)
-        tile_density = round(parameter.density + fill_density, 2)
-        results.append((tile_density, filler_grid, size_, space_))
-
-    closest = min(results, key=lambda x: abs(x[0] - pdk.get_layer_density(layer)))
-    min_fill = pdk.get_layer_density(layer) - pdk.get_layer_deviation(layer)
-    max_fill = pdk.get_layer_density(layer) + pdk.get_layer_deviation(layer)
-
-    if parameter.max_depth == 0:
-        return (closest[1], round(closest[0] - parameter.density, 2))
-    if closest[0] > min_fill and closest[0] < max_fill:
-        return (closest[1], round(closest[0] - parameter.density, 2))
-
-    min_size = min(parameter.position[0], closest[2])
-    max_size = max(parameter.position[0], closest[2])
-    min_space = min(parameter.position[1], closest[3])
-    max_space = max(parameter.position[1], closest[3])
-    start_size = midpoint_snapped(min_size, max_size)
-    start_space = midpoint_snapped(min_space, max_space)
-
-    size = (min_size, max_size)
-    space = (min_space, max_space)
-    position = (start_size, start_space)
-    parameter = parameter.next(size, space, position, closest[0])
-
-    return _fill_square(pdk, layer, tile, annotated_cell, parameter)
-
-
-def _fill_square_logic(pdk, layer: str, tile, annotated_cell, square_size: float, space: float):
+    target = pdk.get_layer_density(layer)
+    min_fill = target - pdk.get_layer_deviation(layer)
+    max_fill = target + pdk.get_layer_deviation(layer)
+    # Filler grids and their fill densities by (size, space) of the current level. Only
+    # the best combination carries over, the narrowed interval keeps it as one corner.
+    grids = {}
+
+    while True:
+        results = []
+        for (size_, space_) in itertools.product(parameter.size, parameter.space):
+            if (size_, space_) not in grids:
+                filler_grid = _fill_square_logic(pdk, layer, tile, placement, keep_out,
+                                                 size_, space_)
+                grids[(size_, space_)] = (filler_grid,
+                                          calculate_fill_density(annotated_cell, filler_grid))
+            filler_grid, fill_density = grids[(size_, space_)]
+            tile_density = round(parameter.density + fill_density, 2)
+            results.append((tile_density, filler_grid, size_, space_))
+
+        closest = min(results, key=lambda x: abs(x[0] - target))
+
+        if parameter.max_depth == 0:
+            return (closest[1], round(closest[0] - parameter.density, 2))
+        if closest[0] > min_fill and closest[0] < max_fill:
+            return (closest[1], round(closest[0] - parameter.density, 2))
+        grids = {(closest[2], closest[3]): grids[(closest[2], closest[3])]}
+
+        min_size = min(parameter.position[0], closest[2])
+        max_size = max(parameter.position[0], closest[2])
+        min_space = min(parameter.position[1], closest[3])
+        max_space = max(parameter.position[1], closest[3])
+        start_size = midpoint_snapped(min_size, max_size)
+        start_space = midpoint_snapped(min_space, max_space)
+
+        size = (min_size, max_size)
+        space = (min_space, max_space)
+        position = (start_size, start_space)
+        parameter = parameter.next(size, space, position, closest[0])
+
+
+def _fill_square_logic(pdk, layer: str, tile, placement: list, keep_out: list,
+                       square_size: float, space: float):
     """
     Generate and validate square filler polygons for a given size and spacing.
 
@@ -177,7 +188,8 @@ def _fill_square_logic(pdk, layer: str, tile, annotated_cell, square_size: float
         pdk (object): Provides layer rules.
         layer (str): Target layer.
         tile (object): Current tile instance.
-        annotated_cell (gdstk.Cell): Cell used for overlap checks.
+        placement (list[gdstk.Polygon]): Chip placement polygons the squares must lie in.
+        keep_out (list[gdstk.Polygon]): Keep-out polygons the squares must avoid.
         square_size (float): Candidate square size.
         space (float): Spacing between squares.
 
@@ -198,17 +210,19 @@ def _fill_square_logic(pdk, layer: str, tile, annotated_cell, square_size: float
     tile_width = pdk.get_layer_tile_width(layer)
     filler = lib.new_cell('FILLER')
     drift = snap_to_grid((square_size + space) / 2)
-    for x in range(0, int(tile_width / offset)):
-        for y in range(0, int(tile_width / offset)):
-            square_offset = drift if x % 2 else 0
-            filler.add(gdstk.Reference(cell_ref,
-                       origin=(tile.x + x * offset, tile.y + square_offset + y * offset)))
+    count = int(tile_width / offset)
+    # Even and odd columns as two reference arrays, odd columns shifted up by the drift
+    if count > 0:
+        filler.add(gdstk.Reference(cell_ref, origin=(tile.x, tile.y), columns=(count + 1) // 2,
+                                   rows=count, spacing=(2 * offset, offset)))
+    if count > 1:
+        filler.add(gdstk.Reference(cell_ref, origin=(tile.x + offset, tile.y + drift),
+                                   columns=count // 2, rows=count, spacing=(2 * offset, offset)))
 
     filler_cell = gdstk.Cell(name='FILLER_CELL_SQUARE')
-    valid_fills = gdstk.boolean(filler.get_polygons(),
-                                get_polygons(annotated_cell, 'placement_chip'),
+    valid_fills = gdstk.boolean(filler.get_polygons(), placement,
                                 operation='and', layer=layerindex, datatype=datatype)
-    final = gdstk.boolean(valid_fills, get_polygons(annotated_cell, 'keep_out'),
+    final = gdstk.boolean(valid_fills, keep_out,
                           operation='not', layer=layerindex, datatype=datatype)
 
     clipping_disabled = not fill_rules.get('clipping', True)
@@ -11,8 +11,8 @@ respecting layer rules, spacing, and keep-out regions.
 # pylint: disable=too-many-locals, too-many-arguments, too-many-positional-arguments
 import gdstk
 from gdsfill.library.filler.helper import (
+    area_percentage,
     calculate_core_density,
-    calculate_core_fill_density,
     calculate_fill_density,
     check_min_size,
     get_layer,
@@ -34,8 +34,8 @@ def add_filler_cells(annotated_cell, filler_cells, gaps: float):
         filler_cells (gdstk.Cell): The cell containing candidate filler polygons.
         gaps (float): The spacing offset applied to the filler polygons before insertion.
     """
-    poly_with_offset = gdstk.offset(filler_cells.get_polygons(), gaps, **get_layer('keep_out'))
-    annotated_cell.add(*(poly for poly in poly_with_offset))
+    poly_with_offset = gdstk.offset(filler_cells.polygons, gaps, **get_layer('keep_out'))
+    annotated_cell.add(*poly_with_offset)
 
 
 def fill_track(pdk, layer: str, tile, annotated_cell, fill_density: float):
@@ -59,24 +59,35 @@ def fill_track(pdk, layer: str, tile, annotated_cell, fill_density: float):
     fill_rules = pdk.get_fill_rules(layer, 'Track')
     density = calculate_core_density(annotated_cell) + fill_density
     min_fill = pdk.get_layer_density(layer) - pdk.get_layer_deviation(layer)
+    if density > min_fill:
+        return (gdstk.Cell(name='FILLER_CELL_TRACK_EMPTY'), 0.0)
 
-    if not get_polygons(annotated_cell, 'placement_core'):
+    placement = get_polygons(annotated_cell, 'placement_core')
+    if not placement:
         return (gdstk.Cell(name='FILLER_CELL_TRACK_EMPTY'), 0.0)
 
-    valid_tracks = gdstk.boolean(get_polygons(annotated_cell, 'drawing'),
-                                 get_polygons(annotated_cell, 'placement_core'),
+    valid_tracks = gdstk.boolean(get_polygons(annotated_cell, 'drawing'), placement,
                                  operation='and')
     offset_x = get_track_offset(valid_tracks, tile.x, fill_rules['gaps'])
     if offset_x is None:
         return (gdstk.Cell(name='FILLER_CELL_TRACK_EMPTY'), 0.0)
     offset_y = 0
+    # The keep-out only grows once the final fillers are added, so fetch it once
+    keep_out = get_polygons(annotated_cell, 'keep_out')
 
     filler_cells = gdstk.Cell(name='FILLER_CELL_TRACK')
+    # Spaced outlines of the accepted fillers, grown as new fillers are added
+    spaced_filler = []
+    core_area = sum(polygon.area() for polygon in placement)
     for step in range(0, 4):
         offsets = (offset_x + step * fill_rules['gaps'], offset_y + fill_rules['gaps'])
         for width in range(50, 10, -5):
-            _fill_track_logic(pdk, layer, tile, annotated_cell, filler_cells, width / 10, offsets)
-            fill_density = density + calculate_core_fill_density(annotated_cell, filler_cells)
+            _fill_track_logic(pdk, layer, tile, placement, keep_out, filler_cells,
+                              spaced_filler, width / 10, offsets)
+            # Clip the union of all fillers, so overlapping fillers are not counted twice
+            core_fill = gdstk.boolean(placement, filler_cells.polygons, operation='and')
+            fill_density = density + area_percentage(
+                sum(polygon.area() for polygon in core_fill), core_area)
             if fill_density > min_fill:
                 tile_fill_density = calculate_fill_density(annotated_cell, filler_cells)
                 add_filler_cells(annotated_cell, filler_cells, fill_rules['gaps'])
@@ -87,8 +98,8 @@ def fill_track(pdk, layer: str, tile, annotated_cell, fill_density: float):
     return (filler_cells, round(tile_fill_density, 2))
 
 
-def _fill_track_logic(pdk, layer: str, tile, annotated_cell, filler_cells, width: int,
-                      offsets: tuple[float, float]):
+def _fill_track_logic(pdk, layer: str, tile, placement: list, keep_out: list, filler_cells,
+                      spaced_filler: list, width: int, offsets: tuple[float, float]):
     """
     Generate filler polygons for a single track iteration.
 
@@ -100,8 +111,11 @@ def _fill_track_logic(pdk, layer: str, tile, annotated_cell, filler_cells, width
         pdk (object): Process design kit providing layer indices, datatypes, and rules.
         layer (str): Layer name being filled.
         tile (object): Current tile with x/y position and size attributes.
-        annotated_cell (gdstk.Cell): The target cell used for density calculations.
+        placement (list[gdstk.Polygon]): Core placement polygons the tracks must lie in.
+        keep_out (list[gdstk.Polygon]): Keep-out polygons the tracks must avoid.
         filler_cells (gdstk.Cell): Cell where valid filler polygons are accumulated.
+        spaced_filler (list[gdstk.Polygon]): Accepted fillers grown by the gap rule; extended
+            with the polygons added in this iteration.
         width (int): Candidate filler width in track units.
         offsets (tuple[float, float]): (x, y) offsets applied when placing filler cells.
     """
@@ -119,40 +133,40 @@ def _fill_track_logic(pdk, layer: str, tile, annotated_cell, filler_cells, width
     offset_x = cell_width + fill_rules['gaps']
     offset_y = cell_height + fill_rules['gaps']
 
-    lib = gdstk.Library(name="filler")
-    rect = gdstk.rectangle((0, 0), (cell_width, cell_height), layer=layerindex, datatype=datatype)
-    reference = lib.new_cell('REFERENCE')
-    cell_ref = reference.add(rect)
-
     tile_width = pdk.get_layer_tile_width(layer)
-    filler = lib.new_cell('FILLER')
-
-    for x in range(0, int(tile_width / offset_x)):
-        for y in range(0, int(tile_width / offset_y)):
-            ref_x = tile.x + offsets[0] + x * offset_x
-            ref_y = tile.y + offsets[1] + y * offset_y
-            filler.add(gdstk.Reference(cell_ref, origin=(ref_x, ref_y)))
-
-    existing_filler = gdstk.offset(filler_cells.get_polygons(), fill_rules['gaps'])
-    valid_fills = gdstk.boolean(filler.get_polygons(),
-                                get_polygons(annotated_cell, 'placement_core'),
+    columns = int(tile_width / offset_x)
+    rows = int(tile_width / offset_y)
+    grid = []
+    if columns and rows:
+        # Expand the track grid in C from one repeated rectangle
+        rect = gdstk.rectangle((0, 0), (cell_width, cell_height),
+                               layer=layerindex, datatype=datatype)
+        rect.translate(tile.x + offsets[0], tile.y + offsets[1])
+        rect.repetition = gdstk.Repetition(columns, rows, spacing=(offset_x, offset_y))
+        grid = [rect] + rect.apply_repetition()
+
+    valid_fills = gdstk.boolean(grid, placement,
                                 operation='and', layer=layerindex, datatype=datatype)
-
-    valid_fills2 = gdstk.boolean(valid_fills, existing_filler,
-                                 operation='not', layer=layerindex, datatype=datatype)
-    final = gdstk.boolean(valid_fills2, get_polygons(annotated_cell, 'keep_out'),
+    # Subtract spaced existing fills and keep-out regions in a single pass
+    final = gdstk.boolean(valid_fills, spaced_filler + keep_out,
                           operation='not', layer=layerindex, datatype=datatype)
 
     aggressive_fill = fill_rules.get('aggressive_fill', False)
+    accepted = []
     for poly in final:
+        # Reduce notched polygons first, then accept each polygon at most once
+        reduced = False
         if aggressive_fill and poly.size == 8:
             poly = remove_shortest_edge(poly.points, layerindex, datatype)
             poly = remove_shortest_edge(poly.points, layerindex, datatype)
-            if check_min_size(poly.points, min_width, min_width):
-                filler_cells.add(poly)
+            reduced = True
         if poly.size == 6:
             poly = remove_shortest_edge(poly.points, layerindex, datatype)
-            if check_min_size(poly.points, min_width, min_width):
-                filler_cells.add(poly)
-        if poly.size == 4 and check_min_size(poly.points, min_width, min_width):
-            filler_cells.add(poly)
+            reduced = True
+        if (reduced or poly.size == 4) and check_min_size(poly, min_width, min_width):
+            accepted.append(poly)
+
+    if accepted:
+        filler_cells.add(*accepted)
+        # Only the new fillers need spacing, earlier ones are already in the list
+        spaced_filler.extend(gdstk.offset(accepted, fill_rules['gaps']))